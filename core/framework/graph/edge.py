@@ -22,6 +22,7 @@
 given the current goal, context, and execution state.
 """
 
+from array import array
 from enum import Enum
 from typing import Any
 
@@ -463,13 +464,18 @@ def detect_fan_out_nodes(self) -> dict[str, list[str]]:
         Returns:
             Dict mapping source_node_id -> list of parallel target_node_ids
         """
+        # Fan-out: multiple edges with ON_SUCCESS condition.
+        # Group in one pass over the edges instead of scanning them per node.
+        success_edges: dict[str, list[EdgeSpec]] = {}
+        for edge in self.edges:
+            if edge.condition == EdgeCondition.ON_SUCCESS:
+                success_edges.setdefault(edge.source, []).append(edge)
+
         fan_outs: dict[str, list[str]] = {}
         for node in self.nodes:
-            outgoing = self.get_outgoing_edges(node.id)
-            # Fan-out: multiple edges with ON_SUCCESS condition
-            success_edges = [e for e in outgoing if e.condition == EdgeCondition.ON_SUCCESS]
-            if len(success_edges) > 1:
-                fan_outs[node.id] = [e.target for e in success_edges]
+            outgoing = success_edges.get(node.id, [])
+            if len(outgoing) > 1:
+                fan_outs[node.id] = [e.target for e in sorted(outgoing, key=lambda e: -e.priority)]
         return fan_outs
 
     def detect_fan_in_nodes(self) -> dict[str, list[str]]:
@@ -482,13 +488,163 @@ def detect_fan_in_nodes(self) -> dict[str, list[str]]:
         Returns:
             Dict mapping target_node_id -> list of source_node_ids
         """
+        sources: dict[str, list[str]] = {}
+        for edge in self.edges:
+            sources.setdefault(edge.target, []).append(edge.source)
+
         fan_ins: dict[str, list[str]] = {}
         for node in self.nodes:
-            incoming = self.get_incoming_edges(node.id)
+            incoming = sources.get(node.id, [])
             if len(incoming) > 1:
-                fan_ins[node.id] = [e.source for e in incoming]
+                fan_ins[node.id] = incoming
         return fan_ins
 
+    def detect_cycles(self) -> list[str]:
+        """
+        Detect cycles in the graph structure.
+
+        Loops are legitimate in agent graphs (retry loops, continuous
+        monitors), so cycles are reported here rather than by validate().
+        Edge conditions are ignored: detection is purely structural.
+
+        A Kahn in-degree peel runs first: if it consumes every node the
+        graph is acyclic and nothing else runs. Otherwise an iterative
+        Tarjan SCC pass over the unpeeled residue reports exactly one cycle
+        per strongly connected component with more than one node (or a
+        self-loop). Both passes are O(V + E) and non-recursive.
+
+        Returns:
+            One description per cycle, e.g. "Cycle detected: Node A → Node B → Node A"
+        """
+        adjacency = self._build_adjacency()
+
+        # Intern node IDs to declaration-order indices so the SCC pass
+        # works on flat arrays instead of string-keyed dicts
+        node_ids = list(adjacency)
+        ix = {node_id: i for i, node_id in enumerate(node_ids)}
+        successors = [[ix[target] for target in adjacency[node_id]] for node_id in node_ids]
+        n = len(node_ids)
+
+        # Peel nodes with no remaining predecessors; only cycles and the
+        # nodes downstream of them are left behind
+        indegree = array("l", [0]) * n
+        for targets in successors:
+            for w in targets:
+                indegree[w] += 1
+        peeled = bytearray(n)
+        ready = [v for v in range(n) if indegree[v] == 0]
+        remaining = n
+        while ready:
+            v = ready.pop()
+            peeled[v] = 1
+            remaining -= 1
+            for w in successors[v]:
+                indegree[w] -= 1
+                if indegree[w] == 0:
+                    ready.append(w)
+        if not remaining:
+            return []
+
+        # Peeled nodes are unreachable from the residue, so Tarjan never visits them
+        index = array("l", [-1]) * n
+        lowlink = array("l", [0]) * n
+        on_stack = bytearray(n)
+        scc_id = array("l", [0]) * n
+        scc_stack: list[int] = []
+        cyclic_sccs: list[list[int]] = []
+        counter = 0
+
+        for root in range(n):
+            if peeled[root] or index[root] != -1:
+                continue
+            index[root] = lowlink[root] = counter
+            counter += 1
+            scc_stack.append(root)
+            on_stack[root] = 1
+            work_stack = [(root, iter(successors[root]))]
+
+            while work_stack:
+                v, succ_iter = work_stack[-1]
+                for w in succ_iter:
+                    if index[w] == -1:
+                        index[w] = lowlink[w] = counter
+                        counter += 1
+                        scc_stack.append(w)
+                        on_stack[w] = 1
+                        work_stack.append((w, iter(successors[w])))
+                        break
+                    if on_stack[w] and index[w] < lowlink[v]:
+                        lowlink[v] = index[w]
+                else:
+                    work_stack.pop()
+                    if work_stack:
+                        parent = work_stack[-1][0]
+                        if lowlink[v] < lowlink[parent]:
+                            lowlink[parent] = lowlink[v]
+                    if lowlink[v] == index[v]:
+                        scc = []
+                        while True:
+                            member = scc_stack.pop()
+                            on_stack[member] = 0
+                            scc_id[member] = index[v]  # Root index identifies the SCC
+                            scc.append(member)
+                            if member == v:
+                                break
+                        if len(scc) > 1 or v in successors[v]:
+                            cyclic_sccs.append(scc)
+
+        # Paths start at the node that closes the cycle, not necessarily the SCC's
+        # first-declared node; sorting the index sequences keeps output deterministic
+        names = {node.id: node.name for node in self.nodes}
+        cycles = sorted(self._find_cycle_path(min(scc), scc_id, successors) for scc in cyclic_sccs)
+        return [
+            "Cycle detected: " + " → ".join(names[node_ids[i]] for i in path) for path in cycles
+        ]
+
+    def _build_adjacency(self) -> dict[str, list[str]]:
+        """
+        Map each node ID to the IDs of its successors in one pass over the edges.
+
+        Edges referencing missing nodes are skipped (validate() reports them).
+        Not cached, since nodes and edges are mutable lists.
+        """
+        adjacency: dict[str, list[str]] = {node.id: [] for node in self.nodes}
+        for edge in self.edges:
+            if edge.source in adjacency and edge.target in adjacency:
+                adjacency[edge.source].append(edge.target)
+        return adjacency
+
+    @staticmethod
+    def _find_cycle_path(start: int, scc_id: array, successors: list[list[int]]) -> list[int]:
+        """
+        Walk start's strongly connected component until a back edge closes a cycle.
+
+        The walk never leaves the component, so it only touches the cyclic subgraph.
+        """
+        component = scc_id[start]
+        path = [start]
+        enter_index = {start: 0}  # Position of each on-path node within path
+        visited = {start}
+        stack = [iter(successors[start])]
+        while stack:
+            for succ in stack[-1]:
+                if scc_id[succ] != component:
+                    continue
+                if succ in enter_index:
+                    cycle = path[enter_index[succ] :]
+                    cycle.append(succ)
+                    return cycle
+                if succ not in visited:
+                    visited.add(succ)
+                    enter_index[succ] = len(path)
+                    path.append(succ)
+                    stack.append(iter(successors[succ]))
+                    break
+            else:
+                stack.pop()
+                del enter_index[path.pop()]
+        return path
+
     def get_entry_point(self, session_state: dict | None = None) -> str:
         """
         Get the appropriate entry point based on session state.
@@ -524,9 +680,16 @@ def get_entry_point(self, session_state: dict | None = None) -> str:
     def validate(self) -> list[str]:
         """Validate the graph structure."""
         errors = []
+        node_ids = {node.id for node in self.nodes}
+
+        # Successors over all edges, keeping dangling endpoints so the
+        # reachability walk still passes through missing node IDs
+        successors: dict[str, list[str]] = {}
+        for edge in self.edges:
+            successors.setdefault(edge.source, []).append(edge.target)
 
         # Check entry node exists
-        if not self.get_node(self.entry_node):
+        if self.entry_node not in node_ids:
             errors.append(f"Entry node '{self.entry_node}' not found")
 
         # Check async entry points
@@ -538,7 +701,7 @@ def validate(self) -> list[str]:
             seen_entry_ids.add(entry_point.id)
 
             # Check entry node exists
-            if not self.get_node(entry_point.entry_node):
+            if entry_point.entry_node not in node_ids:
                 errors.append(
                     f"Async entry point '{entry_point.id}' references "
                     f"missing node '{entry_point.entry_node}'"
@@ -562,14 +725,14 @@ def validate(self) -> list[str]:
 
         # Check terminal nodes exist
         for term in self.terminal_nodes:
-            if not self.get_node(term):
+            if term not in node_ids:
                 errors.append(f"Terminal node '{term}' not found")
 
         # Check edge references
         for edge in self.edges:
-            if not self.get_node(edge.source):
+            if edge.source not in node_ids:
                 errors.append(f"Edge '{edge.id}' references missing source '{edge.source}'")
-            if not self.get_node(edge.target):
+            if edge.target not in node_ids:
                 errors.append(f"Edge '{edge.id}' references missing target '{edge.target}'")
 
         # Check for unreachable nodes
@@ -591,8 +754,7 @@ def validate(self) -> list[str]:
             if current in reachable:
                 continue
             reachable.add(current)
-            for edge in self.get_outgoing_edges(current):
-                to_visit.append(edge.target)
+            to_visit.extend(successors.get(current, ()))
 
         # Build set of async entry point nodes for quick lookup
         async_entry_nodes = {ep.entry_node for ep in self.async_entry_points}
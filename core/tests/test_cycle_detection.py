@@ -0,0 +1,142 @@
+"""
+Tests for GraphSpec.detect_cycles().
+
+Covers:
+- Acyclic graphs (linear, branching, convergence, multiple entry points)
+- Simple two-node cycle
+- Self-loop
+- Cycle through conditional edges
+- Complex cycle inside a larger graph
+- validate() does not treat loops as errors, and still walks dangling edges
+"""
+
+import pytest
+
+from framework.graph.edge import EdgeCondition, EdgeSpec, GraphSpec
+from framework.graph.node import NodeSpec
+
+
+def _make_graph(
+    node_ids: list[str],
+    edges: list[tuple[str, str]],
+    entry: str = "A",
+    terminals: list[str] | None = None,
+    condition: EdgeCondition = EdgeCondition.ON_SUCCESS,
+) -> GraphSpec:
+    """Build a graph whose node X is named 'Node X'."""
+    nodes = [
+        NodeSpec(id=nid, name=f"Node {nid}", description=f"node {nid}", node_type="function")
+        for nid in node_ids
+    ]
+    return GraphSpec(
+        id="cycle_graph",
+        goal_id="g1",
+        entry_node=entry,
+        terminal_nodes=terminals or [],
+        nodes=nodes,
+        edges=[
+            EdgeSpec(id=f"{src}_to_{tgt}", source=src, target=tgt, condition=condition)
+            for src, tgt in edges
+        ],
+    )
+
+
+# (case id, node IDs, edges, edge condition, expected cycles)
+CASES = [
+    ("linear", ["A", "B", "C"], [("A", "B"), ("B", "C")], EdgeCondition.ON_SUCCESS, []),
+    (
+        "simple_cycle",
+        ["A", "B"],
+        [("A", "B"), ("B", "A")],
+        EdgeCondition.ON_SUCCESS,
+        ["Cycle detected: Node A → Node B → Node A"],
+    ),
+    (
+        "self_loop",
+        ["A", "B"],
+        [("A", "A"), ("A", "B")],
+        EdgeCondition.ON_SUCCESS,
+        ["Cycle detected: Node A → Node A"],
+    ),
+    (
+        "branching",
+        ["A", "B", "C", "D"],
+        [("A", "B"), ("A", "C"), ("B", "D")],
+        EdgeCondition.ON_SUCCESS,
+        [],
+    ),
+    (
+        "convergence",
+        ["A", "B", "C", "D"],
+        [("A", "B"), ("A", "C"), ("B", "D"), ("C", "D")],
+        EdgeCondition.ON_SUCCESS,
+        [],
+    ),
+    # Edge conditions are ignored: detection is structural
+    (
+        "conditional_cycle",
+        ["A", "B", "C"],
+        [("A", "B"), ("B", "A"), ("B", "C")],
+        EdgeCondition.CONDITIONAL,
+        ["Cycle detected: Node A → Node B → Node A"],
+    ),
+    # Only the B → C → D loop is reported, not the acyclic nodes around it
+    (
+        "complex_cycle",
+        ["A", "B", "C", "D", "E"],
+        [("A", "B"), ("B", "C"), ("C", "D"), ("D", "B"), ("D", "E")],
+        EdgeCondition.ON_SUCCESS,
+        ["Cycle detected: Node B → Node C → Node D → Node B"],
+    ),
+    # Each strongly connected component yields one cycle
+    (
+        "separate_cycles",
+        ["A", "B", "C", "D"],
+        [("A", "B"), ("B", "A"), ("B", "C"), ("C", "D"), ("D", "C")],
+        EdgeCondition.ON_SUCCESS,
+        [
+            "Cycle detected: Node A → Node B → Node A",
+            "Cycle detected: Node C → Node D → Node C",
+        ],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "node_ids,edges,condition,expected",
+    [case[1:] for case in CASES],
+    ids=[case[0] for case in CASES],
+)
+def test_detect_cycles(node_ids, edges, condition, expected):
+    """detect_cycles() reports exactly the expected cycles."""
+    graph = _make_graph(node_ids, edges, condition=condition)
+    assert graph.detect_cycles() == expected
+
+
+def test_multiple_entry_points_no_cycle():
+    """Named entry points do not affect cycle detection."""
+    graph = _make_graph(["A", "B", "C"], [("A", "C"), ("B", "C")], terminals=["C"])
+    graph.entry_points = {"alt": "B"}
+    assert graph.detect_cycles() == []
+
+
+def test_validate_allows_loops():
+    """Loops are legal, so validate() does not report them."""
+    graph = _make_graph(["A", "B", "C"], [("A", "B"), ("B", "C"), ("C", "A")])
+    assert graph.validate() == []
+
+
+def test_validate_walks_through_missing_nodes():
+    """Reachability still follows edges out of missing node IDs."""
+    graph = _make_graph(
+        ["A", "B", "C"],
+        [("Y", "A"), ("Y", "B"), ("A", "X"), ("X", "C")],
+        entry="Y",
+    )
+    assert graph.validate() == [
+        "Entry node 'Y' not found",
+        "Edge 'Y_to_A' references missing source 'Y'",
+        "Edge 'Y_to_B' references missing source 'Y'",
+        "Edge 'A_to_X' references missing target 'X'",
+        "Edge 'X_to_C' references missing source 'X'",
+    ]